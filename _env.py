@@ -0,0 +1,11 @@
+"""Shared .env configuration for the automation scripts"""
+
+import os
+from functools import lru_cache
+from dotenv import dotenv_values, find_dotenv
+
+
+@lru_cache(maxsize=1)
+def env():
+    """Parse .env once per process; real environment variables take precedence."""
+    return {**dotenv_values(find_dotenv()), **os.environ}
@@ -0,0 +1,98 @@
+"""Shared Git helpers for the automation scripts"""
+
+import os
+from functools import lru_cache
+
+from git import Repo
+
+from _env import env
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+@lru_cache(maxsize=4)
+def get_repo(path):
+    """Return a shared Repo for path; refs and HEAD are re-read lazily on use."""
+    return Repo(path)
+
+
+def read_head(git_dir):
+    """Return the current branch name, or None when HEAD is detached."""
+    with open(os.path.join(git_dir, 'HEAD')) as f:
+        head = f.read().strip()
+    prefix = 'ref: refs/heads/'
+    if head.startswith(prefix):
+        return head[len(prefix):]
+    return None
+
+
+def list_heads(git_dir):
+    """Return {branch name: commit sha} from packed-refs and refs/heads/."""
+    heads = {}
+    packed = os.path.join(git_dir, 'packed-refs')
+    if os.path.exists(packed):
+        with open(packed) as f:
+            for line in f:
+                if line.startswith(('#', '^')):
+                    continue
+                sha, _, ref = line.strip().partition(' ')
+                if ref.startswith('refs/heads/'):
+                    heads[ref[len('refs/heads/'):]] = sha
+
+    # Loose refs are newer than their packed copies, so they win
+    root = os.path.join(git_dir, 'refs', 'heads')
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                else:
+                    name = os.path.relpath(entry.path, root).replace(os.sep, '/')
+                    with open(entry.path) as f:
+                        heads[name] = f.read().strip()
+    return dict(sorted(heads.items()))
+
+
+if pygit2 is not None:
+    class _PushCallbacks(pygit2.RemoteCallbacks):
+        """Authenticate with the .env token and surface rejected refs."""
+
+        def __init__(self):
+            username, token = env().get('GITHUB_USERNAME'), env().get('GITHUB_TOKEN')
+            credentials = pygit2.UserPass(username or 'git', token) if token else None
+            super().__init__(credentials=credentials)
+
+        def push_update_reference(self, refname, message):
+            if message is not None:
+                raise pygit2.GitError(f"{refname} rejected: {message}")
+
+
+@lru_cache(maxsize=4)
+def _pygit2_repo(git_dir):
+    return pygit2.Repository(git_dir)
+
+
+def push(repo, ref):
+    """Push a branch or tag to origin.
+
+    HTTP(S) remotes are pushed in-process through pygit2 when it is
+    installed, so repeated pushes in one session skip spawning
+    git-push/send-pack and authenticate with the .env token. Other remotes
+    (e.g. SSH), a missing pygit2, or a failed pygit2 push use GitPython.
+    """
+    if pygit2 is not None:
+        try:
+            pg_repo = _pygit2_repo(repo.git_dir)
+            remote = pg_repo.remotes['origin']
+            if remote.url.startswith(('https://', 'http://')):
+                refname = pg_repo.lookup_reference_dwim(ref).name
+                remote.push([f"{refname}:{refname}"], callbacks=_PushCallbacks())
+                return
+        except (pygit2.GitError, KeyError, TypeError):
+            # TypeError: pygit2 rejects a credential the remote does not accept
+            pass
+    repo.remotes.origin.push(ref)
@@ -1,23 +1,152 @@
 #!/usr/bin/env python3
 """Docs Pusher - Build LaTeX and Push to GitHub"""
 
+import hashlib
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
-from git import Repo
+from _env import env
+from _git import get_repo, push
 import sys
 
-load_dotenv()
+# Files a build writes for its own document, never treated as its inputs
+OUTPUT_EXTENSIONS = ('.aux', '.log', '.out', '.toc', '.fls', '.pdf', '.aux.sha')
+
+def _recorded_inputs(fls_path):
+    """Paths pdflatex -recorder listed as INPUT in the .fls file."""
+    inputs = []
+    pwd = os.path.dirname(fls_path)
+    try:
+        with open(fls_path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                kind, _, path = line.rstrip('\n').partition(' ')
+                if kind == 'PWD':
+                    pwd = path
+                elif kind == 'INPUT':
+                    inputs.append(os.path.normpath(os.path.join(pwd, path)))
+    except OSError:
+        pass
+    return inputs
+
+def _pdf_is_current(pdf_path):
+    """True if the PDF is newer than everything the document may depend on.
+
+    That is every file under the document's directory (figs/, chapters/,
+    PDF figures included) plus any INPUT recorded by pdflatex -recorder,
+    excluding only this document's own outputs.
+    """
+    try:
+        pdf_mtime = os.stat(pdf_path).st_mtime_ns
+    except OSError:
+        return False
+    base = os.path.splitext(pdf_path)[0]
+    own_outputs = {base + ext for ext in OUTPUT_EXTENSIONS}
+    candidates = set(_recorded_inputs(base + '.fls'))
+    for root, _, files in os.walk(os.path.dirname(pdf_path)):
+        candidates.update(os.path.join(root, name) for name in files)
+    for path in candidates - own_outputs:
+        try:
+            if os.stat(path).st_mtime_ns > pdf_mtime:
+                return False
+        except OSError:
+            return False  # an input vanished; rebuild to be safe
+    return True
+
+def build_latex(tex_file_path):
+    """Build one .tex file; returns (pdf_path or None, size in bytes, messages).
+
+    Module-level so it can run in a worker process without pickling the Repo.
+    Progress lines are returned rather than printed so that parallel builds
+    do not interleave their output.
+    Paths are plain strings here; Path stays at the public boundary.
+    """
+    tex_str = os.path.abspath(os.fspath(tex_file_path))
+    parent, tex_name = os.path.split(tex_str)
+    stem = os.path.splitext(tex_name)[0]
+    base = os.path.join(parent, stem)
+    aux_path = base + '.aux'
+    sha_path = base + '.aux.sha'
+    pdf_path = base + '.pdf'
+    log = [f"\nBuilding: {tex_name}"]
+    try:
+        aux_digest = None
+        for run in range(2):
+            if run == 1:
+                # Same .aux as the last build and an up-to-date PDF means
+                # the second pass would not resolve anything new
+                old_digest = None
+                if os.path.exists(sha_path):
+                    with open(sha_path) as f:
+                        old_digest = f.read().strip()
+                if aux_digest and aux_digest == old_digest and _pdf_is_current(pdf_path):
+                    log.append("  Run 2/2 skipped (cross-references unchanged)")
+                    break
+            log.append(f"  Run {run+1}/2...")
+            if run == 0:
+                # Draft pass only writes .aux/.toc, skipping the PDF backend
+                # -recorder lists every file read in the .fls for _pdf_is_current
+                cmd = ['pdflatex', '-interaction=batchmode', '-halt-on-error',
+                       '-draftmode', '-recorder', tex_name]
+            else:
+                cmd = ['pdflatex', '-interaction=nonstopmode', tex_name]
+            result = subprocess.run(
+                cmd,
+                cwd=parent,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60
+            )
+            if result.returncode != 0:
+                # pdflatex writes the full transcript to the .log, which is kept on failure
+                log.append(f"  ✗ Failed (see {stem}.log)")
+                return None, 0, log
+            if run == 0 and os.path.exists(aux_path):
+                with open(aux_path, 'rb') as f:
+                    aux_digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        
+        if aux_digest:
+            with open(sha_path, 'w') as f:
+                f.write(aux_digest + '\n')
+        
+        # One directory listing instead of an exists()/unlink() pair per extension
+        aux_extensions = {'.aux', '.log', '.out', '.toc', '.fls'}
+        with os.scandir(parent) as it:
+            for entry in it:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:] in aux_extensions and name[:dot] == stem:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+        
+        try:
+            size = os.stat(pdf_path).st_size
+        except OSError:
+            log.append(f"  ✗ PDF not created")
+            return None, 0, log
+        log.append(f"  ✓ Built: {stem}.pdf ({size / (1024*1024):.2f} MB)")
+        return pdf_path, size, log
+    
+    except subprocess.TimeoutExpired:
+        log.append(f"  ✗ Timeout")
+        return None, 0, log
+    except FileNotFoundError:
+        log.append(f"  ✗ pdflatex not found. Install TeX Live or MiKTeX")
+        return None, 0, log
+    except Exception as e:
+        log.append(f"  ✗ Error: {e}")
+        return None, 0, log
 
 class DocumentationPusher:
     """Build and push LaTeX documents."""
     
     def __init__(self):
-        self.local_path = os.getenv('LOCAL_REPO_PATH')
+        self.local_path = env().get('LOCAL_REPO_PATH')
         self.docs_dir = Path(self.local_path) / 'docs'
         try:
-            self.repo = Repo(self.local_path)
+            self.repo = get_repo(self.local_path)
         except Exception as e:
             print(f"ERROR: {e}")
             sys.exit(1)
@@ -29,59 +158,6 @@ class DocumentationPusher:
             return []
         return list(self.docs_dir.rglob('*.tex'))
     
-    def build_latex(self, tex_file):
-        try:
-            print(f"\nBuilding: {tex_file.name}")
-            original_dir = os.getcwd()
-            os.chdir(tex_file.parent)
-            
-            for run in range(2):
-                print(f"  Run {run+1}/2...")
-                result = subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', tex_file.name],
-                    capture_output=True,
-                    timeout=60,
-                    text=True
-                )
-                if result.returncode != 0:
-                    print(f"  ✗ Failed")
-                    os.chdir(original_dir)
-                    return False
-            
-            aux_extensions = ['.aux', '.log', '.out', '.toc']
-            for ext in aux_extensions:
-                aux_file = tex_file.with_suffix(ext)
-                if aux_file.exists():
-                    try:
-                        aux_file.unlink()
-                    except:
-                        pass
-            
-            os.chdir(original_dir)
-            pdf_file = tex_file.with_suffix('.pdf')
-            
-            if pdf_file.exists():
-                size_mb = pdf_file.stat().st_size / (1024*1024)
-                print(f"  ✓ Built: {pdf_file.name} ({size_mb:.2f} MB)")
-                self.built_files.append(pdf_file)
-                return True
-            else:
-                print(f"  ✗ PDF not created")
-                return False
-        
-        except subprocess.TimeoutExpired:
-            print(f"  ✗ Timeout")
-            os.chdir(original_dir)
-            return False
-        except FileNotFoundError:
-            print(f"  ✗ pdflatex not found. Install TeX Live or MiKTeX")
-            os.chdir(original_dir)
-            return False
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-            os.chdir(original_dir)
-            return False
-    
     def build_all_docs(self):
         print("\n" + "="*60)
         print("=== Building Documentation ===")
@@ -94,10 +170,17 @@ class DocumentationPusher:
         
         print(f"Found {len(tex_files)} .tex file(s)")
         
+        # Documents are independent, so build them on separate cores
+        workers = min(len(tex_files), os.cpu_count() or 1)
         success_count = 0
-        for tex_file in tex_files:
-            if self.build_latex(tex_file):
-                success_count += 1
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            # map() yields in submission order, so each document's lines print together
+            for pdf_path, size, messages in ex.map(build_latex, [str(f) for f in tex_files]):
+                print("\n".join(messages))
+                # Keep the size measured by the worker so the report needs no re-stat
+                if pdf_path:
+                    self.built_files.append((Path(pdf_path), size))
+                    success_count += 1
         
         print(f"\n✓ Built {success_count}/{len(tex_files)} files successfully")
         return success_count == len(tex_files)
@@ -109,8 +192,8 @@ class DocumentationPusher:
             print("="*60 + "\n")
             
             print("Adding PDF files...")
-            self.repo.git.add('*.pdf')
-            self.repo.git.add('docs/**/*.pdf')
+            # Git pathspec '*' also matches '/', so this covers docs/**/*.pdf
+            self.repo.git.add('--', '*.pdf')
             
             if not self.repo.is_dirty():
                 print("No changes to commit")
@@ -121,7 +204,7 @@ class DocumentationPusher:
             self.repo.index.commit(message)
             
             print("Pushing to remote...")
-            self.repo.remotes.origin.push('main')
+            push(self.repo, 'main')
             
             print("✓ Pushed successfully")
             return True
@@ -141,13 +224,12 @@ class DocumentationPusher:
         
         print(f"Built files ({len(self.built_files)}):")
         total_size = 0
-        for pdf_file in self.built_files:
-            size_mb = pdf_file.stat().st_size / (1024*1024)
-            total_size += size_mb
+        for pdf_file, size in self.built_files:
+            total_size += size
             print(f"  - {pdf_file.name}")
-            print(f"    Size: {size_mb:.2f} MB")
+            print(f"    Size: {size / 1048576.0:.2f} MB")
         
-        print(f"\nTotal: {total_size:.2f} MB | {len(self.built_files)} files")
+        print(f"\nTotal: {total_size / 1048576.0:.2f} MB | {len(self.built_files)} files")
     
     def run(self, push_to_remote=True):
         print("Starting Documentation Pipeline...\n")
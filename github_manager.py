@@ -1,27 +1,49 @@
 #!/usr/bin/env python3
 """GitHub Manager - Interactive Menu-Driven GitHub Operations"""
 
-import os
+import argparse
+import subprocess
 from pathlib import Path
-from dotenv import load_dotenv
-from git import Repo, GitCommandError
+from git import GitCommandError
+from _env import env
+from _git import get_repo, read_head, list_heads, push
 import sys
 
-load_dotenv()
+MENU = "\n".join([
+    "",
+    "="*60,
+    "GitHub Repository Manager",
+    "="*60,
+    "",
+    "1. View Status",
+    "2. View History",
+    "3. Add Files",
+    "4. Commit",
+    "5. Push",
+    "6. Pull",
+    "7. Create Branch",
+    "8. Switch Branch",
+    "9. Create Tag",
+    "10. List Branches",
+    "11. Complete Workflow",
+    "0. Exit",
+    "",
+])
 
 class GitHubManager:
     """Interactive GitHub repository manager."""
     
     def __init__(self):
-        self.username = os.getenv('GITHUB_USERNAME')
-        self.local_path = os.getenv('LOCAL_REPO_PATH')
+        self.username = env().get('GITHUB_USERNAME')
+        self.local_path = env().get('LOCAL_REPO_PATH')
         self.repo = None
         self.running = True
+        self.ask = input
     
     def setup_repo(self):
         try:
             if Path(self.local_path).exists():
-                self.repo = Repo(self.local_path)
+                self.repo = get_repo(self.local_path)
                 print(f"✓ Connected to {self.local_path}")
                 return True
             else:
@@ -32,26 +54,12 @@ class GitHubManager:
             return False
     
     def display_menu(self):
-        print("\n" + "="*60)
-        print("GitHub Repository Manager")
-        print("="*60)
-        print("\n1. View Status")
-        print("2. View History")
-        print("3. Add Files")
-        print("4. Commit")
-        print("5. Push")
-        print("6. Pull")
-        print("7. Create Branch")
-        print("8. Switch Branch")
-        print("9. Create Tag")
-        print("10. List Branches")
-        print("11. Complete Workflow")
-        print("0. Exit")
+        sys.stdout.write(MENU)
     
     def view_status(self):
         print("\n--- Status ---")
         try:
-            print(f"Branch: {self.repo.active_branch.name}")
+            print(f"Branch: {read_head(self.repo.git_dir) or 'HEAD (detached)'}")
             print(f"Dirty: {self.repo.is_dirty()}")
             print(f"Untracked: {len(self.repo.untracked_files)}")
         except Exception as e:
@@ -60,9 +68,20 @@ class GitHubManager:
     def view_history(self):
         print("\n--- Commit History ---")
         try:
-            commits = list(self.repo.iter_commits('HEAD', max_count=5))
-            for i, commit in enumerate(commits, 1):
-                print(f"{i}. {commit.hexsha[:7]} - {commit.message.strip()[:50]}")
+            # Print each commit as git emits it rather than after the walk
+            with subprocess.Popen(
+                ['git', '-C', self.local_path, 'log', '-n5',
+                 '--pretty=format:%H%x00%s'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding='utf-8',
+                errors='replace'
+            ) as proc:
+                for i, line in enumerate(proc.stdout, 1):
+                    sha, subject = line.rstrip('\n').split('\0', 1)
+                    print(f"{i}. {sha[:7]} - {subject.strip()[:50]}")
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
         except Exception as e:
             print(f"ERROR: {e}")
     
@@ -74,7 +93,7 @@ class GitHubManager:
             print(f"ERROR: {e}")
     
     def commit_changes(self):
-        msg = input("Commit message: ").strip()
+        msg = self.ask("Commit message: ").strip()
         if not msg:
             print("ERROR: Message cannot be empty")
             return
@@ -86,7 +105,7 @@ class GitHubManager:
     
     def push_changes(self):
         try:
-            self.repo.remotes.origin.push('main')
+            push(self.repo, 'main')
             print("✓ Pushed")
         except Exception as e:
             print(f"ERROR: {e}")
@@ -99,7 +118,7 @@ class GitHubManager:
             print(f"ERROR: {e}")
     
     def create_branch(self):
-        name = input("Branch name: ").strip()
+        name = self.ask("Branch name: ").strip()
         if not name:
             print("ERROR: Name cannot be empty")
             return
@@ -110,7 +129,7 @@ class GitHubManager:
             print(f"ERROR: {e}")
     
     def switch_branch(self):
-        name = input("Branch name: ").strip()
+        name = self.ask("Branch name: ").strip()
         if not name:
             print("ERROR: Name cannot be empty")
             return
@@ -121,16 +140,16 @@ class GitHubManager:
             print(f"ERROR: {e}")
     
     def create_tag(self):
-        name = input("Tag name: ").strip()
+        name = self.ask("Tag name: ").strip()
         if not name:
             print("ERROR: Name cannot be empty")
             return
         try:
             self.repo.create_tag(name)
             print(f"✓ Tag created: {name}")
-            push = input("Push tag? (y/n): ").strip().lower()
-            if push == 'y':
-                self.repo.remotes.origin.push(name)
+            answer = self.ask("Push tag? (y/n): ").strip().lower()
+            if answer == 'y':
+                push(self.repo, name)
                 print("✓ Tag pushed")
         except Exception as e:
             print(f"ERROR: {e}")
@@ -138,15 +157,16 @@ class GitHubManager:
     def list_branches(self):
         print("\n--- Branches ---")
         try:
-            for head in self.repo.heads:
-                current = " (current)" if head == self.repo.active_branch else ""
-                print(f"  {head.name}{current}")
+            active = read_head(self.repo.git_dir)
+            for name in list_heads(self.repo.common_dir):
+                current = " (current)" if name == active else ""
+                print(f"  {name}{current}")
         except Exception as e:
             print(f"ERROR: {e}")
     
     def complete_workflow(self):
         print("\n--- Complete Workflow ---")
-        msg = input("Commit message: ").strip()
+        msg = self.ask("Commit message: ").strip()
         if not msg:
             print("ERROR: Message cannot be empty")
             return
@@ -161,13 +181,41 @@ class GitHubManager:
             print("   ✓ Committed")
             
             print("3. Pushing...")
-            self.repo.remotes.origin.push('main')
+            push(self.repo, 'main')
             print("   ✓ Pushed")
             
             print("\n✓ Workflow complete!")
         except Exception as e:
             print(f"ERROR: {e}")
     
+    def dispatch(self, choice):
+        if choice == '1':
+            self.view_status()
+        elif choice == '2':
+            self.view_history()
+        elif choice == '3':
+            self.add_files()
+        elif choice == '4':
+            self.commit_changes()
+        elif choice == '5':
+            self.push_changes()
+        elif choice == '6':
+            self.pull_changes()
+        elif choice == '7':
+            self.create_branch()
+        elif choice == '8':
+            self.switch_branch()
+        elif choice == '9':
+            self.create_tag()
+        elif choice == '10':
+            self.list_branches()
+        elif choice == '11':
+            self.complete_workflow()
+        elif choice == '0':
+            self.running = False
+        else:
+            print("ERROR: Invalid option")
+    
     def run(self):
         if not self.setup_repo():
             return
@@ -175,40 +223,44 @@ class GitHubManager:
         while self.running:
             self.display_menu()
             choice = input("Option: ").strip()
-            
-            if choice == '1':
-                self.view_status()
-            elif choice == '2':
-                self.view_history()
-            elif choice == '3':
-                self.add_files()
-            elif choice == '4':
-                self.commit_changes()
-            elif choice == '5':
-                self.push_changes()
-            elif choice == '6':
-                self.pull_changes()
-            elif choice == '7':
-                self.create_branch()
-            elif choice == '8':
-                self.switch_branch()
-            elif choice == '9':
-                self.create_tag()
-            elif choice == '10':
-                self.list_branches()
-            elif choice == '11':
-                self.complete_workflow()
-            elif choice == '0':
-                self.running = False
-            else:
-                print("ERROR: Invalid option")
+            self.dispatch(choice)
             
             if choice != '0':
                 input("Press Enter to continue...")
+    
+    def run_batch(self, filename):
+        """Run menu options (and their prompt answers) read up-front from a file."""
+        if not self.setup_repo():
+            return
+        
+        with open(filename) as f:
+            lines = iter(f.read().splitlines())
+        
+        def ask(prompt=""):
+            line = next(lines, None)
+            if line is None:
+                raise EOFError
+            print(f"{prompt}{line}")
+            return line
+        
+        self.ask = ask
+        try:
+            while self.running:
+                self.dispatch(self.ask("Option: ").strip())
+        except EOFError:
+            pass
 
 def main():
+    parser = argparse.ArgumentParser(description="Interactive GitHub repository manager")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="read menu options and prompt answers from FILE, one per line")
+    args = parser.parse_args()
+    
     manager = GitHubManager()
-    manager.run()
+    if args.batch:
+        manager.run_batch(args.batch)
+    else:
+        manager.run()
 
 if __name__ == "__main__":
     main()
@@ -2,89 +2,201 @@
 """GitHub Monitor - Repository Status Monitoring"""
 
 from pathlib import Path
-from git import Repo
-from dotenv import load_dotenv
+from _env import env
+from _git import get_repo, read_head, list_heads
 import os
+import subprocess
 from datetime import datetime
 import json
 import sys
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+REPORT_CACHE = Path.home() / '.cache' / 'border_guard' / 'status.json'
 
 class GitHubMonitor:
     """Monitor repository status."""
     
     def __init__(self):
-        self.local_path = os.getenv('LOCAL_REPO_PATH')
+        self.local_path = env().get('LOCAL_REPO_PATH')
         if not self.local_path:
             print("ERROR: LOCAL_REPO_PATH not set in .env")
             sys.exit(1)
         
         try:
-            self.repo = Repo(self.local_path)
+            self.repo = get_repo(self.local_path)
         except Exception as e:
             print(f"ERROR: {e}")
             sys.exit(1)
+        
+        # The repo does not change within one run, so reports share lookups
+        self._status_cache = None
+        self._history_cache = {}
+        self._branches_cache = None
+        self._porcelain_cache = None
+    
+    def _porcelain_status(self):
+        """Parse one `git status --porcelain` scan into (XY, path) entries."""
+        if self._porcelain_cache is not None:
+            return self._porcelain_cache
+        out = self.repo.git.status('--porcelain=v1', '-z', '--untracked-files=all')
+        entries = []
+        fields = iter(out.split('\0'))
+        for field in fields:
+            if not field:
+                continue
+            code, path = field[:2], field[3:]
+            if 'R' in code or 'C' in code:
+                next(fields, None)  # skip the rename/copy source path
+            entries.append((code, path))
+        self._porcelain_cache = entries
+        return entries
+    
+    def _fingerprint(self):
+        """HEAD, branch SHAs and index/config mtimes; any ref move changes it."""
+        git_dir = Path(self.repo.git_dir)
+        common_dir = Path(self.repo.common_dir)
+        paths = [git_dir / 'index', common_dir / 'config']
+        mtimes = [os.stat(p).st_mtime_ns if p.exists() else 0 for p in paths]
+        # Compare ref contents rather than refs/heads mtimes, which miss
+        # commits on nested branches such as feature/x
+        head = (git_dir / 'HEAD').read_text().strip()
+        heads = [[name, sha] for name, sha in list_heads(common_dir).items()]
+        return [head, heads, mtimes]
+    
+    def _restore_report(self, fingerprint):
+        """Fill the caches from the last report if the repo is unchanged."""
+        try:
+            with open(REPORT_CACHE) as f:
+                cached = json.load(f).get(str(self.repo.common_dir))
+        except (OSError, ValueError):
+            return False
+        if not cached or cached.get('fingerprint') != fingerprint:
+            return False
+        
+        # Working-tree state is not covered by the fingerprint, so rescan it
+        entries = self._porcelain_status()
+        self._status_cache = dict(
+            cached['summary'],
+            timestamp=datetime.now().isoformat(),
+            dirty=any(code != '??' for code, _ in entries),
+            untracked_files=sum(1 for code, _ in entries if code == '??')
+        )
+        self._branches_cache = cached['branches']
+        self._history_cache[5] = cached['history']
+        return True
+    
+    def _store_report(self, fingerprint):
+        """Persist the report parts that only depend on refs and HEAD."""
+        status = self.get_status_summary()
+        branches = self.get_branch_info()
+        history = self.get_commit_history(5)
+        if 'error' in status or any('error' in item for item in branches + history):
+            return
+        try:
+            with open(REPORT_CACHE) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        data[str(self.repo.common_dir)] = {
+            'fingerprint': fingerprint,
+            'summary': status,
+            'branches': branches,
+            'history': history
+        }
+        try:
+            REPORT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(REPORT_CACHE, 'w') as f:
+                json.dump(data, f)
+        except OSError:
+            pass
     
     def get_status_summary(self):
         """Get comprehensive repository status."""
+        if self._status_cache is not None:
+            return self._status_cache
         try:
-            return {
+            entries = self._porcelain_status()
+            self._status_cache = {
                 'timestamp': datetime.now().isoformat(),
-                'branch': self.repo.active_branch.name,
-                'dirty': self.repo.is_dirty(),
-                'untracked_files': len(self.repo.untracked_files),
-                'total_commits': sum(1 for _ in self.repo.iter_commits()),
+                'branch': read_head(self.repo.git_dir) or 'HEAD (detached)',
+                'dirty': any(code != '??' for code, _ in entries),
+                'untracked_files': sum(1 for code, _ in entries if code == '??'),
+                'total_commits': int(self.repo.git.rev_list('--count', 'HEAD')),
                 'last_commit': self.repo.head.commit.message.strip()[:100],
                 'last_commit_author': self.repo.head.commit.author.name,
                 'remote_url': list(self.repo.remotes.origin.urls)[0] if self.repo.remotes else 'N/A'
             }
+            return self._status_cache
         except Exception as e:
             return {'error': str(e)}
     
     def get_commit_history(self, limit=5):
         """Get recent commit history."""
+        if limit in self._history_cache:
+            return self._history_cache[limit]
         commits = []
         try:
-            for commit in list(self.repo.iter_commits('HEAD', max_count=limit)):
+            # One native `git log` instead of a GitPython Commit per entry
+            result = subprocess.run(
+                ['git', '-C', self.local_path, 'log', f'-n{limit}',
+                 '--pretty=format:%H%x00%ct%x00%an%x00%s'],
+                capture_output=True,
+                encoding='utf-8',
+                errors='replace',
+                check=True
+            )
+            for line in result.stdout.splitlines():
+                sha, committed, author, subject = line.split('\0', 3)
                 commits.append({
-                    'hash': commit.hexsha[:7],
-                    'date': datetime.fromtimestamp(commit.committed_date).isoformat(),
-                    'message': commit.message.strip().split('\n')[0][:60],
-                    'author': commit.author.name
+                    'hash': sha[:7],
+                    'date': datetime.fromtimestamp(int(committed)).isoformat(),
+                    'message': subject.strip()[:60],
+                    'author': author
                 })
         except Exception as e:
             commits.append({'error': str(e)})
+            return commits
         
+        self._history_cache[limit] = commits
         return commits
     
     def get_branch_info(self):
         """Get information about all branches."""
+        if self._branches_cache is not None:
+            return self._branches_cache
         branches = []
         try:
-            for head in self.repo.heads:
-                current = head == self.repo.active_branch
+            active = read_head(self.repo.git_dir)
+            for name, sha in list_heads(self.repo.common_dir).items():
                 branches.append({
-                    'name': head.name,
-                    'current': current,
-                    'commit': head.commit.hexsha[:7]
+                    'name': name,
+                    'current': name == active,
+                    'commit': sha[:7]
                 })
         except Exception as e:
             branches.append({'error': str(e)})
+            return branches
         
+        self._branches_cache = branches
         return branches
     
     def get_file_changes(self):
         """Get changed files."""
         changed = []
         try:
-            if self.repo.is_dirty():
-                for item in self.repo.untracked_files[:10]:
+            entries = self._porcelain_status()
+            if any(code != '??' for code, _ in entries):
+                untracked = [path for code, path in entries if code == '??']
+                for item in untracked[:10]:
                     changed.append(f"  ? {item}")
                 
-                diff_index = self.repo.index.diff('HEAD')
-                for diff in diff_index[:10]:
-                    changed.append(f"  M {diff.a_path}")
+                staged = [path for code, path in entries if code[0] not in ' ?']
+                for path in staged[:10]:
+                    changed.append(f"  M {path}")
         except Exception as e:
             changed.append(f"ERROR: {e}")
         
@@ -92,6 +204,14 @@ class GitHubMonitor:
     
     def print_status(self):
         """Print detailed status report."""
+        # git status may refresh the index, so scan before fingerprinting
+        try:
+            self._porcelain_status()
+            fingerprint = self._fingerprint()
+            if not self._restore_report(fingerprint):
+                self._store_report(fingerprint)
+        except Exception:
+            pass  # fall back to the uncached getters below
         status = self.get_status_summary()
         
         print("\n" + "="*70)
@@ -134,8 +254,8 @@ class GitHubMonitor:
         
         print("\n" + "="*70 + "\n")
     
-    def export_json(self, filename='repo_status.json'):
-        """Export status to JSON file."""
+    def export_json(self, filename='repo_status.json', compact=False):
+        """Export status to JSON file (compact=True for machine consumers)."""
         try:
             data = {
                 'summary': self.get_status_summary(),
@@ -143,8 +263,15 @@ class GitHubMonitor:
                 'branches': self.get_branch_info()
             }
             
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            if compact and orjson is not None:
+                with open(filename, 'wb', buffering=65536) as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=65536) as f:
+                    if compact:
+                        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                    else:
+                        json.dump(data, f, indent=2)
             
             print(f"✓ Exported to {filename}")
             return True